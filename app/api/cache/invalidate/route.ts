@@ -12,7 +12,7 @@ export async function POST(request: NextRequest) {
       );
     }
     
-    const cacheManager = new WidgetCacheManager();
+    const cacheManager = WidgetCacheManager.getInstance();
     // Invalidate dashboard cache instead since we removed job-related functionality
     await cacheManager.invalidateDashboardCache(dashboardId);
     const result = { widgetsInvalidated: 0, dashboardCacheCleared: true };
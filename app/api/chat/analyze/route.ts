@@ -4,8 +4,25 @@ import { headers } from "next/headers";
 import { v4 as uuidv4 } from 'uuid';
 import { getDashboardFiles } from '@/app/lib/actions';
 import { addMessage } from '@/app/lib/chatActions';
-import { Client } from '@langchain/langgraph-sdk';
+import type { Client } from '@langchain/langgraph-sdk';
+import { logger } from '@/lib/logger';
 
+// Reuse one LangGraph client across requests so its HTTP connections are
+// kept alive instead of being re-established on every analyze call
+let langGraphClient: Client | null = null;
+
+async function getLangGraphClient(apiUrl: string): Promise<Client> {
+  if (!langGraphClient) {
+    // Load the SDK on first use so cold starts and requests rejected during
+    // validation don't pay for importing it
+    const { Client: LangGraphClient } = await import('@langchain/langgraph-sdk');
+    langGraphClient = new LangGraphClient({
+      apiUrl,
+      apiKey: process.env.LANGSMITH_API_KEY
+    });
+  }
+  return langGraphClient;
+}
 
 export async function POST(request: NextRequest) {
   // Get the current user
@@ -35,7 +52,7 @@ export async function POST(request: NextRequest) {
   }
 
   try {
-    console.log('Chat analyze endpoint called with message:', message);
+    logger.debug('Chat analyze endpoint called with message:', message);
 
     // Get API URL from environment
     const API_URL = process.env.API_URL;
@@ -56,52 +73,51 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Initialize LangGraph client
-    const client = new Client({ 
-      apiUrl: API_URL,
-      apiKey: process.env.LANGSMITH_API_KEY 
-    });
+    // Get the shared LangGraph client
+    const client = await getLangGraphClient(API_URL);
 
     // Generate request ID
     const request_id = "req_" + uuidv4();
 
-    // Fetch file_ids using dashboardId
-    let file_ids: string[] = [];
-    try {
-      const dashboardFiles = await getDashboardFiles(dashboardId, userId);
-      if (dashboardFiles && Array.isArray(dashboardFiles)) {
-        file_ids = dashboardFiles.map(file => file.id);
-      }
-    } catch (error) {
-      console.warn('Could not fetch dashboard files:', error);
-      // Continue with empty file_ids array
-    }
+    // Fetch file_ids using dashboardId. Started here so it overlaps with the
+    // assistant lookup below instead of running before it.
+    const fileIdsPromise: Promise<string[]> = getDashboardFiles(dashboardId, userId)
+      .then(dashboardFiles => (dashboardFiles && Array.isArray(dashboardFiles))
+        ? dashboardFiles.map(file => file.id)
+        : [])
+      .catch(error => {
+        console.warn('Could not fetch dashboard files:', error);
+        // Continue with empty file_ids array
+        return [];
+      });
 
     // Prepare context_widget_ids
     const context_widget_ids = contextWidgetIds && Array.isArray(contextWidgetIds) ? contextWidgetIds : [];
 
-    // Prepare input data for the assistant
-    const inputData = {
-      user_prompt: message,
-      dashboard_id: dashboardId,
-      file_ids,
-      context_widget_ids,
-      user_id: userId,
-      chat_id: chatId,
-      request_id: request_id
-    };
+    try {
+      // Step 1: List available assistants to debug (concurrently with the file lookup)
+      logger.debug('Listing available assistants...');
+      const [assistants, file_ids] = await Promise.all([
+        client.assistants.search({
+          metadata: null,
+          offset: 0,
+          limit: 10,
+        }),
+        fileIdsPromise,
+      ]);
 
-    console.log('Sending request to LangGraph:', { assistantId, inputData });
+      // Prepare input data for the assistant
+      const inputData = {
+        user_prompt: message,
+        dashboard_id: dashboardId,
+        file_ids,
+        context_widget_ids,
+        user_id: userId,
+        chat_id: chatId,
+        request_id: request_id
+      };
 
-    try {
-      // Step 1: List available assistants to debug
-      console.log('Listing available assistants...');
-      const assistants = await client.assistants.search({
-        metadata: null,
-        offset: 0,
-        limit: 10,
-      });
-      console.log('Available assistants:', assistants.map(a => ({ id: a.assistant_id, name: a.name || 'unnamed' })));
+      logger.debug('Sending request to LangGraph:', { assistantId, inputData });
 
       // Check if the specified assistant exists
       const targetAssistant = assistants.find(a => a.assistant_id === assistantId);
@@ -111,14 +127,14 @@ export async function POST(request: NextRequest) {
         // If no assistants exist, suggest using the first available one
         if (assistants.length > 0) {
           const firstAssistant = assistants[0];
-          console.log(`Using first available assistant: ${firstAssistant.assistant_id}`);
+          logger.debug(`Using first available assistant: ${firstAssistant.assistant_id}`);
           
           // Update the assistant ID to use the first available one
           const actualAssistantId = firstAssistant.assistant_id;
           
           // Step 2: Create thread using LangGraph SDK
           const thread = await client.threads.create();
-          console.log('Thread created successfully:', thread);
+          logger.debug('Thread created:', thread.thread_id);
 
           // Step 3: Create a background run using LangGraph SDK with the available assistant
           const backgroundRun = await client.runs.create(
@@ -129,7 +145,7 @@ export async function POST(request: NextRequest) {
             }
           );
 
-          console.log('Background run created:', backgroundRun);
+          logger.debug('Background run created:', backgroundRun.run_id);
 
           return NextResponse.json({
             success: true,
@@ -154,7 +170,7 @@ export async function POST(request: NextRequest) {
 
       // Step 2: Create thread using LangGraph SDK
       const thread = await client.threads.create();
-      console.log('Thread created successfully:', thread);
+      logger.debug('Thread created:', thread.thread_id);
 
       // Step 3: Create a background run using LangGraph SDK
       const backgroundRun = await client.runs.create(
@@ -165,7 +181,7 @@ export async function POST(request: NextRequest) {
         }
       );
 
-      console.log('Background run created:', backgroundRun);
+      logger.debug('Background run created:', backgroundRun.run_id);
 
       return NextResponse.json({
         success: true,
@@ -178,23 +194,16 @@ export async function POST(request: NextRequest) {
     } catch (sdkError) {
       console.error('LangGraph SDK error:', sdkError);
       
-      // Enhanced error logging
-      if (sdkError instanceof Error) {
-        console.error('Error name:', sdkError.name);
-        console.error('Error message:', sdkError.message);
-        console.error('Error stack:', sdkError.stack);
-      }
-      
       // Add system message about backend unavailability
       if (chatId) {
         try {
-          console.log('🔄 Adding system error message to chat:', chatId);
+          logger.debug('🔄 Adding system error message to chat:', chatId);
           await addMessage(chatId, userId, {
             role: 'system',
             content: 'Something went wrong with the analysis service, please try again later.',
             messageType: 'chat'
           });
-          console.log('✅ System error message added successfully');
+          logger.debug('✅ System error message added successfully');
         } catch (msgError) {
           console.error('❌ Failed to add system message:', msgError);
         }
@@ -232,13 +241,13 @@ export async function POST(request: NextRequest) {
       // Add system message about backend unavailability instead of throwing error
       if (chatId) {
         try {
-          console.log('🔄 Adding system error message to chat:', chatId);
+          logger.debug('🔄 Adding system error message to chat:', chatId);
           await addMessage(chatId, userId, {
             role: 'system',
             content: 'Something went wrong, please try again later.',
             messageType: 'chat'
           });
-          console.log('✅ System error message added successfully');
+          logger.debug('✅ System error message added successfully');
         } catch (msgError) {
           console.error('❌ Failed to add system message:', msgError);
         }
@@ -4,14 +4,22 @@ import { headers } from "next/headers";
 import { renameChat } from '@/app/lib/chatActions';
 import { OpenAI } from 'openai';
 
-// Initialize OpenAI client only when needed
+const TITLE_SYSTEM_PROMPT = "You are a helpful assistant that generates concise, descriptive titles for chat conversations. Based on the user's first message, create a short title (2-6 words) that captures the main intent. Focus on the key subject or action they want to accomplish.";
+
+// Initialize OpenAI client only when needed, then reuse it (and its
+// keep-alive connections) across requests
+let openaiClient: OpenAI | null = null;
+
 const getOpenAIClient = () => {
   if (!process.env.OPENAI_API_KEY) {
     throw new Error('OpenAI API key is not configured');
   }
-  return new OpenAI({
-    apiKey: process.env.OPENAI_API_KEY,
-  });
+  if (!openaiClient) {
+    openaiClient = new OpenAI({
+      apiKey: process.env.OPENAI_API_KEY,
+    });
+  }
+  return openaiClient;
 };
 
 export async function POST(request: NextRequest) {
@@ -48,7 +56,7 @@ export async function POST(request: NextRequest) {
         messages: [
           {
             role: "system",
-            content: "You are a helpful assistant that generates concise, descriptive titles for chat conversations. Based on the user's first message, create a short title (2-6 words) that captures the main intent. Focus on the key subject or action they want to accomplish."
+            content: TITLE_SYSTEM_PROMPT
           },
           {
             role: "user",
@@ -1,5 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { parse } from 'csv-parse/sync';
+import { fetchParsedCsv } from '@/lib/csv-cache';
 
 export async function GET(request: NextRequest) {
   try {
@@ -29,32 +29,17 @@ export async function GET(request: NextRequest) {
       );
     }
 
-    // Fetch the remote CSV file
-    const response = await fetch(filePath, {
-      method: 'HEAD'
-    });
+    // Fetch and parse the remote CSV file (reused while the file is unchanged)
+    const result = await fetchParsedCsv(filePath);
     
-    if (!response.ok) {
+    if (!result.ok) {
       return NextResponse.json(
-        { error: `Failed to fetch file: ${response.statusText}` },
-        { status: response.status }
+        { error: `Failed to fetch file: ${result.statusText}` },
+        { status: result.status }
       );
     }
     
-    // Get basic file info from response headers
-    const lastModified = response.headers.get('last-modified');
-    const contentLength = response.headers.get('content-length');
-    
-    // Make a separate request to get the content for parsing
-    const contentResponse = await fetch(filePath);
-    const fileContent = await contentResponse.text();
-    
-    // Parse CSV content to get rows and columns
-    const records = parse(fileContent, {
-      skip_empty_lines: true,
-      trim: true,
-    });
-    
+    const { records, size, lastModified } = result.csv;
     const rows = records.length;
     const columns = rows > 0 ? records[0].length : 0;
     
@@ -63,7 +48,7 @@ export async function GET(request: NextRequest) {
     const fileName = urlObj.pathname.split('/').pop() || 'unknown.csv';
 
     return NextResponse.json({
-      size: parseInt(contentLength || '0', 10),
+      size,
       created: lastModified || new Date().toISOString(),
       modified: lastModified || new Date().toISOString(),
       rows,
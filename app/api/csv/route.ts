@@ -1,5 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { parse } from 'csv-parse/sync';
+import { fetchParsedCsv } from '@/lib/csv-cache';
 
 export async function GET(request: NextRequest) {
   try {
@@ -32,24 +32,17 @@ export async function GET(request: NextRequest) {
       );
     }
 
-    // Fetch the remote CSV file
-    const response = await fetch(filePath);
+    // Fetch and parse the remote CSV file (reused while the file is unchanged)
+    const result = await fetchParsedCsv(filePath);
     
-    if (!response.ok) {
+    if (!result.ok) {
       return NextResponse.json(
-        { error: `Failed to fetch file: ${response.statusText}` },
-        { status: response.status }
+        { error: `Failed to fetch file: ${result.statusText}` },
+        { status: result.status }
       );
     }
     
-    // Get the file content
-    const fileContent = await response.text();
-    
-    // Parse CSV content
-    const allRecords = parse(fileContent, {
-      skip_empty_lines: true,
-      trim: true,
-    });
+    const allRecords = result.csv.records;
 
     // Get total records count and headers
     const totalRecords = allRecords.length;
@@ -6,6 +6,8 @@ import { dashboards, themes, ThemeStyleProps } from "@/db/schema";
 import { eq, and } from "drizzle-orm";
 import { THEME_PRESETS } from "@/lib/theme-presets";
 
+const THEME_MODES = ['light', 'dark', 'system'];
+
 // GET /api/dashboard/[dashboardId]/theme - Get the active theme for a dashboard
 export async function GET(
   request: NextRequest,
@@ -93,28 +95,36 @@ export async function PUT(
     const body = await request.json();
     const { themeId, themeMode } = body;
 
-    // Verify dashboard belongs to user
-    const dashboard = await db.select().from(dashboards)
-      .where(and(eq(dashboards.id, dashboardId), eq(dashboards.userId, userId)))
-      .limit(1);
+    // Reject bad input before touching the database
+    if (themeId === undefined && themeMode === undefined) {
+      return NextResponse.json({ error: "themeId or themeMode is required" }, { status: 400 });
+    }
+    if (themeMode !== undefined && !THEME_MODES.includes(themeMode)) {
+      return NextResponse.json({ error: "Invalid themeMode" }, { status: 400 });
+    }
+
+    // Verify the dashboard belongs to the user and, if themeId is provided,
+    // look up the user theme at the same time - the two checks are independent
+    const [dashboard, userTheme] = await Promise.all([
+      db.select({ id: dashboards.id }).from(dashboards)
+        .where(and(eq(dashboards.id, dashboardId), eq(dashboards.userId, userId)))
+        .limit(1),
+      themeId
+        ? db.select({ id: themes.id }).from(themes)
+            .where(and(eq(themes.id, themeId), eq(themes.userId, userId)))
+            .limit(1)
+        : Promise.resolve([]),
+    ]);
 
     if (!dashboard[0]) {
       return NextResponse.json({ error: "Dashboard not found" }, { status: 404 });
     }
 
     // If themeId is provided, verify the theme exists (either in database or as preset)
-    if (themeId) {
-      // First check if it's a user theme
-      const userTheme = await db.select().from(themes)
-        .where(and(eq(themes.id, themeId), eq(themes.userId, userId)))
-        .limit(1);
-
-      // If not found, check if it's a preset theme
-      if (!userTheme[0]) {
-        const presetTheme = THEME_PRESETS.find(p => p.id === themeId);
-        if (!presetTheme) {
-          return NextResponse.json({ error: "Theme not found" }, { status: 404 });
-        }
+    if (themeId && !userTheme[0]) {
+      const presetTheme = THEME_PRESETS.find(p => p.id === themeId);
+      if (!presetTheme) {
+        return NextResponse.json({ error: "Theme not found" }, { status: 404 });
       }
     }
 
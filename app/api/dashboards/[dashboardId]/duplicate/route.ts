@@ -39,15 +39,15 @@ export async function POST(
     const original = originalDashboard[0];
     const newDashboardId = nanoid();
 
-    // Get all widgets from the original dashboard
-    const originalWidgets = await db.select()
-      .from(widgets)
-      .where(eq(widgets.dashboardId, dashboardId));
-
-    // Get all files associated with the original dashboard
-    const originalFiles = await db.select()
-      .from(files)
-      .where(eq(files.dashboardId, dashboardId));
+    // Get all widgets and files from the original dashboard in parallel
+    const [originalWidgets, originalFiles] = await Promise.all([
+      db.select()
+        .from(widgets)
+        .where(eq(widgets.dashboardId, dashboardId)),
+      db.select()
+        .from(files)
+        .where(eq(files.dashboardId, dashboardId)),
+    ]);
 
     // Start transaction
     const result = await db.transaction(async (tx) => {
@@ -63,14 +63,19 @@ export async function POST(
       }).returning();
 
       // 2. Duplicate files and update storage paths
-      const newFiles = [];
-      for (const file of originalFiles) {
-        const newFileId = nanoid();
+      const fileRows = originalFiles.map((file) => {
         const newStoragePath = file.storagePath ? file.storagePath.replace(dashboardId, newDashboardId) : file.storagePath;
-        
+
+        // Copy file in storage (this is a simplified approach - in practice you'd need to copy the actual file)
+        // Note: In a real implementation, you would copy the actual file from storage
+        // For now, we're just updating the path references
+        if (file.storagePath && newStoragePath) {
+          console.log(`File duplication: ${file.storagePath} -> ${newStoragePath}`);
+        }
+
         // Duplicate file record (using the updated schema)
-        const newFile = await tx.insert(files).values({
-          id: newFileId,
+        return {
+          id: nanoid(),
           userId,
           dashboardId: newDashboardId,
           fileType: 'original', // Default to original file type
@@ -79,43 +84,32 @@ export async function POST(
           storagePath: newStoragePath,
           status: 'ready',
           createdAt: new Date(),
-        }).returning();
-
-        newFiles.push(newFile[0]);
+        };
+      });
 
-        // Copy file in storage (this is a simplified approach - in practice you'd need to copy the actual file)
-        if (file.storagePath && newStoragePath) {
-          try {
-            // Note: In a real implementation, you would copy the actual file from storage
-            // For now, we're just updating the path references
-            console.log(`File duplication: ${file.storagePath} -> ${newStoragePath}`);
-          } catch (error) {
-            console.warn('Failed to copy file in storage:', error);
-          }
-        }
-      }
+      // Insert all copies in one statement rather than one round-trip per row
+      const newFiles = fileRows.length > 0
+        ? await tx.insert(files).values(fileRows).returning()
+        : [];
 
       // 3. Files are now linked via dashboardId, so no need to update dashboard record
 
       // 4. Duplicate widgets
-      const newWidgets = [];
-      for (const widget of originalWidgets) {
-        const newWidgetId = nanoid();
-        
-        const newWidget = await tx.insert(widgets).values({
-          id: newWidgetId,
-          dashboardId: newDashboardId,
-          type: widget.type,
-          title: widget.title,
-          config: widget.config,
-          data: widget.data,
-          isConfigured: widget.isConfigured,
-          createdAt: new Date(),
-          updatedAt: new Date(),
-        }).returning();
+      const widgetRows = originalWidgets.map((widget) => ({
+        id: nanoid(),
+        dashboardId: newDashboardId,
+        type: widget.type,
+        title: widget.title,
+        config: widget.config,
+        data: widget.data,
+        isConfigured: widget.isConfigured,
+        createdAt: new Date(),
+        updatedAt: new Date(),
+      }));
 
-        newWidgets.push(newWidget[0]);
-      }
+      const newWidgets = widgetRows.length > 0
+        ? await tx.insert(widgets).values(widgetRows).returning()
+        : [];
 
       return {
         dashboard: newDashboard[0],
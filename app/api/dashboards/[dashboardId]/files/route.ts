@@ -75,10 +75,6 @@ export async function POST(
     });
   } catch (error) {
     console.error('[FILE_DB] ERROR creating file record:', error);
-    console.error('[FILE_DB] Error details:', {
-      message: error instanceof Error ? error.message : 'Unknown error',
-      stack: error instanceof Error ? error.stack : undefined
-    });
     return NextResponse.json(
       { error: 'Failed to create file record' },
       { status: 500 }
@@ -109,7 +109,7 @@ export async function DELETE(
     
     // Verify dashboard ownership
     console.log('[DELETE API] Checking dashboard ownership');
-    const dashboard = await db.select()
+    const dashboard = await db.select({ id: dashboards.id })
       .from(dashboards)
       .where(and(
         eq(dashboards.id, dashboardId),
@@ -161,7 +161,7 @@ export async function DELETE(
       // 5. Delete all files associated with the dashboard
       // Note: In a real implementation, you would also delete the actual files from storage
       console.log('[DELETE API] Getting files for dashboard');
-      const dashboardFiles = await tx.select()
+      const dashboardFiles = await tx.select({ storagePath: files.storagePath })
         .from(files)
         .where(eq(files.dashboardId, dashboardId));
       
@@ -189,7 +189,7 @@ export async function DELETE(
     // Invalidate all related cache entries
     try {
       console.log('[DELETE API] Invalidating cache entries');
-      await dashboardCache.invalidateDashboardList(userId);
+      // Also clears the user's dashboard list
       await dashboardCache.invalidateAllDashboardData(dashboardId, userId);
       console.log(`[DELETE API] Dashboard cache invalidated after deletion for user ${userId}`);
     } catch (cacheError) {
@@ -200,12 +200,6 @@ export async function DELETE(
 
   } catch (error) {
     console.error('[DELETE API] Error deleting dashboard:', error);
-    console.error('[DELETE API] Error stack:', error instanceof Error ? error.stack : 'No stack trace');
-    console.error('[DELETE API] Error details:', {
-      message: error instanceof Error ? error.message : 'Unknown error',
-      name: error instanceof Error ? error.name : 'Unknown',
-      cause: error instanceof Error ? error.cause : undefined
-    });
     return NextResponse.json(
       { 
         error: 'Failed to delete dashboard',
@@ -1,13 +1,10 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { auth } from "@/lib/auth";
 import { headers } from "next/headers";
-import { createClient } from '@supabase/supabase-js';
+import { getStorageClient } from '@/lib/db-with-rls';
 
-const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL || '';
-const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY || process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY || '';
-
-// Create Supabase client with service role key for signed URL generation
-const supabase = createClient(supabaseUrl, supabaseServiceKey);
+// Use the shared service role client for signed URL generation
+const supabase = getStorageClient();
 
 export async function POST(request: NextRequest) {
   try {
@@ -1,16 +1,15 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { auth } from "@/lib/auth";
 import { headers } from "next/headers";
-import { createClient } from '@supabase/supabase-js';
 import { generateSanitizedFilename } from '@/app/lib/utils';
+import { createFile, updateDashboardFile } from '@/app/lib/actions';
+import { dashboardCache, CACHE_KEYS } from '@/lib/redis';
+import { getStorageClient } from '@/lib/db-with-rls';
 import { v4 as uuidv4 } from 'uuid';
 
-const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL || '';
-const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY || process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY || '';
-
-// Create Supabase client with service role key to bypass RLS for uploads
+// Use the shared service role client to bypass RLS for uploads
 // We handle RLS manually by validating the user session
-const supabase = createClient(supabaseUrl, supabaseServiceKey);
+const supabase = getStorageClient();
 
 export async function POST(request: NextRequest) {
   try {
@@ -58,8 +57,7 @@ export async function POST(request: NextRequest) {
       storagePath, 
       fileName: file.name,
       fileSize: file.size,
-      supabaseUrl: supabaseUrl.substring(0, 30) + '...',
-      serviceKeyPresent: !!supabaseServiceKey
+      serviceKeyPresent: !!process.env.SUPABASE_SERVICE_ROLE_KEY
     });
 
     // Upload the file to Supabase storage
@@ -73,9 +71,6 @@ export async function POST(request: NextRequest) {
 
     if (error) {
       console.error('[FILE_UPLOAD] Error uploading to Supabase Storage:', error);
-      console.error('[FILE_UPLOAD] Error details:', {
-        message: error.message
-      });
       
       // Handle specific error cases
       if (error.message.includes('already exists')) {
@@ -96,42 +91,22 @@ export async function POST(request: NextRequest) {
     // Also create the database record
     try {
       console.log('[FILE_UPLOAD] Creating database record...');
-      const createFileResponse = await fetch(`${process.env.NEXTAUTH_URL || 'http://localhost:3000'}/api/dashboards/${dashboardId}/files`, {
-        method: 'POST',
-        headers: { 
-          'Content-Type': 'application/json',
-          // Forward the original request headers for authentication
-          'Cookie': request.headers.get('cookie') || ''
-        },
-        body: JSON.stringify({
-          fileName: file.name,
-          storagePath: storagePath,
-          fileType: 'original',
-          mimeType: file.type,
-          size: file.size,
-        }),
-      });
-
-      if (!createFileResponse.ok) {
-        const errorText = await createFileResponse.text();
-        console.error('[FILE_UPLOAD] Database record creation failed:', errorText);
-        // File is uploaded to storage but DB record failed
-        // Still return success but with a warning
-        return NextResponse.json({
-          success: true,
-          warning: 'File uploaded to storage but database record creation failed',
-          file: {
-            name: file.name,
-            sanitizedName: sanitizedFilename,
-            size: file.size,
-            type: file.type,
-            storagePath: storagePath,
-            uploadPath: data.path,
-          },
-        });
-      }
-
-      const dbResult = await createFileResponse.json();
+      // Write the record directly rather than calling our own
+      // /api/dashboards/[dashboardId]/files route over HTTP, which cost an
+      // extra request and a second session lookup per upload
+      const fileId = uuidv4();
+      const fileRecord = await createFile(
+        fileId,
+        'original',
+        file.name,
+        sanitizedFilename,
+        storagePath,
+        userId,
+        file.type,
+        file.size
+      );
+      await updateDashboardFile(dashboardId, fileId, userId);
+      await dashboardCache.del(CACHE_KEYS.dashboardFiles(dashboardId, userId));
       console.log('[FILE_UPLOAD] Database record created successfully');
 
       return NextResponse.json({
@@ -143,7 +118,7 @@ export async function POST(request: NextRequest) {
           type: file.type,
           storagePath: storagePath,
           uploadPath: data.path,
-          dbRecord: dbResult.file,
+          dbRecord: fileRecord,
         },
       });
     } catch (error) {
@@ -15,7 +15,7 @@ export async function GET(
       return NextResponse.json({ error: "Dashboard ID is required" }, { status: 400 });
     }
 
-    // Fetch dashboard with theme - must be public
+    // Fetch the dashboard with its theme (must be public)
     const result = await db
       .select({
         dashboard: dashboards,
@@ -52,26 +52,23 @@ export async function GET(
       }
     }
 
-    // Fetch widgets for the dashboard
-    const dashboardWidgets = await db
-      .select()
+    // Fetch widgets only once the dashboard is known to be public, selecting
+    // just the fields we expose (excludes sql, chatId, cacheKey, lastDataFetch)
+    const sanitizedWidgets = await db
+      .select({
+        id: widgets.id,
+        type: widgets.type,
+        title: widgets.title,
+        config: widgets.config,
+        data: widgets.data,
+        order: widgets.order,
+        createdAt: widgets.createdAt,
+        updatedAt: widgets.updatedAt,
+      })
       .from(widgets)
       .where(eq(widgets.dashboardId, dashboardId))
       .orderBy(widgets.order);
 
-    // Remove sensitive data from widgets (like SQL queries, chat IDs, etc.)
-    const sanitizedWidgets = dashboardWidgets.map(widget => ({
-      id: widget.id,
-      type: widget.type,
-      title: widget.title,
-      config: widget.config,
-      data: widget.data,
-      order: widget.order,
-      createdAt: widget.createdAt,
-      updatedAt: widget.updatedAt,
-      // Exclude: sql, chatId, cacheKey, lastDataFetch
-    }));
-
     // Remove sensitive data from dashboard
     const sanitizedDashboard = {
       id: dashboard.id,
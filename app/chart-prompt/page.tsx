@@ -13,6 +13,8 @@ export default function ChartPromptPage() {
     error?: string;
   }>({ isValid: false });
   const [chartSpec, setChartSpec] = useState<ChartSpec | null>(null);
+  // Last spec that passed validation, so submit doesn't re-parse and re-validate
+  const [validatedSpec, setValidatedSpec] = useState<ChartSpec | null>(null);
 
   const parseObjectLiteral = (input: string) => {
     try {
@@ -41,8 +43,10 @@ export default function ChartPromptPage() {
       if (result.success) {
         console.log("Validation successful");
         setValidationResult({ isValid: true });
+        setValidatedSpec(result.data);
       } else {
         console.log("Validation errors:", result.error.errors);
+        setValidatedSpec(null);
         setValidationResult({
           isValid: false,
           error: result.error.errors.map(err => `${err.path.join(".")}: ${err.message}`).join("\n")
@@ -50,6 +54,7 @@ export default function ChartPromptPage() {
       }
     } catch (error) {
       console.error("Validation error:", error);
+      setValidatedSpec(null);
       setValidationResult({
         isValid: false,
         error: error instanceof Error ? error.message : "Invalid format"
@@ -58,20 +63,10 @@ export default function ChartPromptPage() {
   };
 
   const handleSubmit = () => {
-    try {
-      const parsedObject = parseObjectLiteral(jsonInput);
-      console.log("Submitting object:", JSON.stringify(parsedObject, null, 2));
-      const result = chartSpecSchema.safeParse(parsedObject);
-      console.log("Submit validation result:", result);
-      
-      if (result.success) {
-        console.log("Setting chart spec:", JSON.stringify(result.data, null, 2));
-        setChartSpec(result.data);
-      } else {
-        console.log("Submit validation errors:", result.error.errors);
-      }
-    } catch (error) {
-      console.error("Submit error:", error);
+    // The input was already parsed and validated on change; reuse that result
+    if (validatedSpec) {
+      console.log("Setting chart spec:", validatedSpec);
+      setChartSpec(validatedSpec);
     }
   };
 
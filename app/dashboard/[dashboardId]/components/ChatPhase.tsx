@@ -11,6 +11,9 @@ import { ChatInput } from "@/components/dashboard/ChatInput";
 import { useDashboardChat } from "../hooks/useDashboardChat";
 import { useChatRealtime } from "@/app/lib/hooks/useChatRealtime";
 
+// Keywords in a system reply that suggest the AI finished building widgets
+const COMPLETION_KEYWORDS_RE = /widget|chart|visualization|dashboard|analysis|created|generated|complete/i;
+
 interface ChatPhaseProps {
   dashboardId: string;
   files: FileRecord[];
@@ -65,17 +68,10 @@ export function ChatPhase({ dashboardId, files, onFirstMessage, onBack, onWidget
             const relevantMessage = completionMessages[0] || recentMessages[recentMessages.length - 1];
             
             // Check if the message content suggests completion (ChatMessage uses 'content' property)
-            const messageContent = (relevantMessage as any).content?.toLowerCase() || '';
+            const messageContent: string = (relevantMessage as any).content || '';
             const indicatesCompletion = (
               hasCompletionMessage || // Has widget IDs, definitely completed
-              messageContent.includes('widget') ||
-              messageContent.includes('chart') ||
-              messageContent.includes('visualization') ||
-              messageContent.includes('dashboard') ||
-              messageContent.includes('analysis') ||
-              messageContent.includes('created') ||
-              messageContent.includes('generated') ||
-              messageContent.includes('complete')
+              COMPLETION_KEYWORDS_RE.test(messageContent)
             );
             
             if (indicatesCompletion && !hasNavigated) {
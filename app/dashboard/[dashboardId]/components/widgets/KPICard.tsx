@@ -12,6 +12,9 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@
 import { cn } from "@/lib/utils";
 import { useDashboardChartColorsCompat as useDashboardChartColors } from "@/hooks/useDashboardChartColorsCompat";
 
+// Common KPI value column names
+const KPI_VALUE_KEY_RE = /total|sum|count|value|amount/i;
+
 // Default styles for KPI cards - now uses theme variables
 const defaultStyles = {
   valueColor: "var(--foreground)", // Theme foreground color
@@ -269,13 +272,7 @@ export function KPICard({ widget, onUpdate, isEditing, onEditToggle }: KPICardPr
       const firstRow = widget.data[0];
       // Look for common KPI value column names
       const valueKeys = Object.keys(firstRow);
-      const kpiKey = valueKeys.find(key => 
-        key.toLowerCase().includes('total') || 
-        key.toLowerCase().includes('sum') ||
-        key.toLowerCase().includes('count') ||
-        key.toLowerCase().includes('value') ||
-        key.toLowerCase().includes('amount')
-      ) || valueKeys[0]; // Use first column if no match
+      const kpiKey = valueKeys.find(key => KPI_VALUE_KEY_RE.test(key)) || valueKeys[0]; // Use first column if no match
       
       return firstRow[kpiKey];
     }
@@ -1,5 +1,4 @@
 import { 
-  getDashboard, 
   getDashboardFiles, 
   getDashboardWidgets,
   getDashboardChats 
@@ -8,24 +7,14 @@ import db from "@/db";
 import { dashboards, themes, ThemeStyleProps } from "@/db/schema";
 import { eq, and } from "drizzle-orm";
 import { THEME_PRESETS } from "@/lib/theme-presets";
+import { logger } from "@/lib/logger";
 
 // Server-side cache utility functions that work with the existing Redis cache
 // These functions are optimized for server components and don't use unstable_cache
 
-export async function getCachedDashboardData(dashboardId: string, userId: string) {
-  try {
-    console.log(`[ServerCache] Loading dashboard data for ${dashboardId}`);
-    const dashboard = await getDashboard(dashboardId, userId);
-    return dashboard;
-  } catch (error) {
-    console.warn(`[ServerCache] Failed to load dashboard ${dashboardId}:`, error);
-    return null;
-  }
-}
-
 export async function getCachedDashboardFiles(dashboardId: string, userId: string) {
   try {
-    console.log(`[ServerCache] Loading files for dashboard ${dashboardId}`);
+    logger.debug(`[ServerCache] Loading files for dashboard ${dashboardId}`);
     // The getDashboardFiles function already has Redis caching built-in
     const files = await getDashboardFiles(dashboardId, userId);
     return files;
@@ -37,7 +26,7 @@ export async function getCachedDashboardFiles(dashboardId: string, userId: strin
 
 export async function getCachedDashboardWidgets(dashboardId: string, userId: string) {
   try {
-    console.log(`[ServerCache] Loading widgets for dashboard ${dashboardId}`);
+    logger.debug(`[ServerCache] Loading widgets for dashboard ${dashboardId}`);
     const widgets = await getDashboardWidgets(dashboardId, userId);
     return widgets;
   } catch (error) {
@@ -48,7 +37,7 @@ export async function getCachedDashboardWidgets(dashboardId: string, userId: str
 
 export async function getCachedDashboardChats(userId: string, dashboardId: string) {
   try {
-    console.log(`[ServerCache] Loading chats for dashboard ${dashboardId}`);
+    logger.debug(`[ServerCache] Loading chats for dashboard ${dashboardId}`);
     const chats = await getDashboardChats(userId, dashboardId);
     return chats;
   } catch (error) {
@@ -59,7 +48,7 @@ export async function getCachedDashboardChats(userId: string, dashboardId: strin
 
 export async function getCachedDashboardTheme(dashboardId: string, userId: string) {
   try {
-    console.log(`[ServerCache] Loading theme for dashboard ${dashboardId}`);
+    logger.debug(`[ServerCache] Loading theme for dashboard ${dashboardId}`);
     
     // Get dashboard with its active theme - same logic as the API route
     const result = await db.select({
@@ -108,27 +97,31 @@ export async function getCachedDashboardTheme(dashboardId: string, userId: strin
   }
 }
 
-// Optimized parallel data fetcher for server components
+// Optimized parallel data fetcher for server components. userId must come
+// from the caller's verified session (DashboardPageServer reads it just
+// before calling this); every query below filters on it for ownership.
 export async function preloadDashboardData(dashboardId: string, userId: string) {
-  console.log(`[ServerCache] Preloading all data for dashboard ${dashboardId}`);
+  logger.debug(`[ServerCache] Preloading all data for dashboard ${dashboardId}`);
   
-  const startTime = Date.now();
+  // Monotonic clock, unaffected by wall-clock adjustments
+  const startTime = performance.now();
   
-  // Load all data in parallel, but with error handling for each
-  const [dashboardData, filesData, widgetsData, chatsData, themeData] = await Promise.allSettled([
-    getCachedDashboardData(dashboardId, userId),
+  // Load all data in parallel, but with error handling for each. The theme
+  // query already returns the full dashboard row (with the same ownership
+  // check), so the dashboard isn't fetched separately.
+  const [filesData, widgetsData, chatsData, themeData] = await Promise.allSettled([
     getCachedDashboardFiles(dashboardId, userId),
     getCachedDashboardWidgets(dashboardId, userId),
     getCachedDashboardChats(userId, dashboardId),
     getCachedDashboardTheme(dashboardId, userId),
   ]);
 
-  const loadTime = Date.now() - startTime;
-  console.log(`[ServerCache] Preload completed in ${loadTime}ms`);
+  const loadTime = performance.now() - startTime;
+  logger.debug(`[ServerCache] Preload completed in ${loadTime.toFixed(1)}ms`);
 
   // Extract data from settled promises
   return {
-    dashboard: dashboardData.status === 'fulfilled' ? dashboardData.value : null,
+    dashboard: themeData.status === 'fulfilled' ? themeData.value?.dashboard ?? null : null,
     files: filesData.status === 'fulfilled' ? filesData.value : [],
     widgets: widgetsData.status === 'fulfilled' ? widgetsData.value : [],
     chats: chatsData.status === 'fulfilled' ? chatsData.value : [],
@@ -226,75 +226,62 @@ export default function ThemeGeneratorPage() {
     const styleElement = document.createElement('style');
     styleElement.id = 'theme-preview-styles';
     
-    let cssRules = `.theme-preview-container {\n`;
+    // Ensure TipTap editor inherits theme colors correctly within the preview
+    const proseMirrorRules = (scope: string) => [
+      `${scope} .ProseMirror {`,
+      `  color: ${currentStyles.foreground} !important;`,
+      `}`,
+      `${scope} .ProseMirror h1,`,
+      `${scope} .ProseMirror h2,`,
+      `${scope} .ProseMirror h3,`,
+      `${scope} .ProseMirror h4,`,
+      `${scope} .ProseMirror h5,`,
+      `${scope} .ProseMirror h6 {`,
+      `  color: ${currentStyles.foreground} !important;`,
+      `}`,
+      `${scope} .ProseMirror p,`,
+      `${scope} .ProseMirror li {`,
+      `  color: ${currentStyles.foreground} !important;`,
+      `}`,
+    ];
+    
+    // Collect the rules and join once instead of growing a string per line
+    const cssLines = [`.theme-preview-container {`];
     
     // Apply all theme styles as CSS variables to the preview container
-    Object.entries(currentStyles).forEach(([key, value]) => {
+    for (const [key, value] of Object.entries(currentStyles)) {
       if (typeof value === "string") {
-        cssRules += `  --${key}: ${value};\n`;
+        cssLines.push(`  --${key}: ${value};`);
       }
-    });
-    
-    // Add the dynamic shadow properties
-    cssRules += `  --preview-shadow: ${dynamicShadow};\n`;
-    cssRules += `  --preview-shadow-color: ${shadowColorWithOpacity};\n`;
-    cssRules += `  --preview-shadow-blur: ${shadowBlur}px;\n`;
-    cssRules += `  --preview-shadow-spread: ${shadowSpread}px;\n`;
-    cssRules += `  --preview-shadow-offset-x: ${shadowOffsetX}px;\n`;
-    cssRules += `  --preview-shadow-offset-y: ${shadowOffsetY}px;\n`;
-    
-    // Apply background and text styles to preview container
-    cssRules += `  background-color: ${currentStyles.background};\n`;
-    cssRules += `  color: ${currentStyles.foreground};\n`;
-    cssRules += `  font-family: ${currentStyles["font-sans"]};\n`;
-    
-    cssRules += `}\n`;
-    
-    // Ensure TipTap editor inherits theme colors correctly within the preview
-    cssRules += `.theme-preview-container .ProseMirror {\n`;
-    cssRules += `  color: ${currentStyles.foreground} !important;\n`;
-    cssRules += `}\n`;
-    
-    cssRules += `.theme-preview-container .ProseMirror h1,\n`;
-    cssRules += `.theme-preview-container .ProseMirror h2,\n`;
-    cssRules += `.theme-preview-container .ProseMirror h3,\n`;
-    cssRules += `.theme-preview-container .ProseMirror h4,\n`;
-    cssRules += `.theme-preview-container .ProseMirror h5,\n`;
-    cssRules += `.theme-preview-container .ProseMirror h6 {\n`;
-    cssRules += `  color: ${currentStyles.foreground} !important;\n`;
-    cssRules += `}\n`;
+    }
     
-    cssRules += `.theme-preview-container .ProseMirror p,\n`;
-    cssRules += `.theme-preview-container .ProseMirror li {\n`;
-    cssRules += `  color: ${currentStyles.foreground} !important;\n`;
-    cssRules += `}\n`;
+    cssLines.push(
+      // Add the dynamic shadow properties
+      `  --preview-shadow: ${dynamicShadow};`,
+      `  --preview-shadow-color: ${shadowColorWithOpacity};`,
+      `  --preview-shadow-blur: ${shadowBlur}px;`,
+      `  --preview-shadow-spread: ${shadowSpread}px;`,
+      `  --preview-shadow-offset-x: ${shadowOffsetX}px;`,
+      `  --preview-shadow-offset-y: ${shadowOffsetY}px;`,
+      // Apply background and text styles to preview container
+      `  background-color: ${currentStyles.background};`,
+      `  color: ${currentStyles.foreground};`,
+      `  font-family: ${currentStyles["font-sans"]};`,
+      `}`,
+      ...proseMirrorRules('.theme-preview-container'),
+    );
     
     // Add dark mode support for preview container
     if (state.previewMode === "dark") {
-      cssRules += `.theme-preview-container.dark {\n`;
-      cssRules += `  color-scheme: dark;\n`;
-      cssRules += `}\n`;
-      
-      cssRules += `.theme-preview-container.dark .ProseMirror {\n`;
-      cssRules += `  color: ${currentStyles.foreground} !important;\n`;
-      cssRules += `}\n`;
-      
-      cssRules += `.theme-preview-container.dark .ProseMirror h1,\n`;
-      cssRules += `.theme-preview-container.dark .ProseMirror h2,\n`;
-      cssRules += `.theme-preview-container.dark .ProseMirror h3,\n`;
-      cssRules += `.theme-preview-container.dark .ProseMirror h4,\n`;
-      cssRules += `.theme-preview-container.dark .ProseMirror h5,\n`;
-      cssRules += `.theme-preview-container.dark .ProseMirror h6 {\n`;
-      cssRules += `  color: ${currentStyles.foreground} !important;\n`;
-      cssRules += `}\n`;
-      
-      cssRules += `.theme-preview-container.dark .ProseMirror p,\n`;
-      cssRules += `.theme-preview-container.dark .ProseMirror li {\n`;
-      cssRules += `  color: ${currentStyles.foreground} !important;\n`;
-      cssRules += `}\n`;
+      cssLines.push(
+        `.theme-preview-container.dark {`,
+        `  color-scheme: dark;`,
+        `}`,
+        ...proseMirrorRules('.theme-preview-container.dark'),
+      );
     }
     
-    styleElement.textContent = cssRules;
+    styleElement.textContent = cssLines.join('\n') + '\n';
     document.head.appendChild(styleElement);
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [state]);
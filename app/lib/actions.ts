@@ -4,19 +4,20 @@ import { withRLS } from '@/lib/db-with-rls';
 import { files, chats, messages, tasks, dashboards, widgets } from '../../db/schema'; // Import Drizzle schemas
 import { eq, and, desc, isNull } from 'drizzle-orm'; // Import eq, and, desc, and isNull operators
 import { v4 as uuidv4 } from 'uuid'; // Assuming you might need UUIDs
-import { createClient } from '@supabase/supabase-js';
+import { supabase } from './supabase';
 import PostHogClient from '@/lib/posthog';
-const posthog = PostHogClient();
 
-// Create server-side supabase client 
-const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL || '';
-const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY || '';
+// Created on first capture so that importing these actions (which most API
+// routes do) doesn't start a PostHog client and its flush timer
+let posthog: ReturnType<typeof PostHogClient> | null = null;
 
-if (!supabaseUrl || !supabaseAnonKey) {
-  console.error('[actions.ts] Missing Supabase environment variables');
+function getPostHog() {
+  if (!posthog) {
+    posthog = PostHogClient();
+  }
+  return posthog;
 }
 
-const supabase = createClient(supabaseUrl, supabaseAnonKey);
 import { ChatMessage, normalizeMessages } from './types';
 import { generateSanitizedFilename } from './utils';
 
@@ -75,7 +76,7 @@ export async function createFile(fileId: string, fileType: string, originalFilen
     }
     
     // Track file creation in PostHog
-    posthog.capture({
+    getPostHog().capture({
       distinctId: userId,
       event: 'file_created',
       properties: {
@@ -152,7 +153,7 @@ export async function createChat(chatId: string, userId: string, dashboardId: st
     }
 
     // Track chat creation in PostHog
-    posthog.capture({
+    getPostHog().capture({
       distinctId: userId,
       event: 'chat_created',
       properties: {
@@ -450,7 +451,7 @@ export async function createDashboard(
     }
 
     // Track dashboard creation in PostHog
-    posthog.capture({
+    getPostHog().capture({
       distinctId: userId,
       event: 'dashboard_created',
       properties: {
@@ -831,10 +832,8 @@ export async function deleteFile(fileId: string, userId: string) {
           
           if (storageError) {
             console.error('Error deleting file from storage:', storageError);
-            console.error('Storage error details:', JSON.stringify(storageError, null, 2));
             // Continue with database deletion even if storage fails to avoid orphaned DB records
-            console.warn(`[deleteFile] Storage deletion failed for ${file.storagePath}, but continuing with database deletion`);
-            console.warn(`[deleteFile] This may leave an orphaned file in storage that can be overwritten on re-upload`);
+            console.warn(`[deleteFile] Storage deletion failed for ${file.storagePath}, but continuing with database deletion. This may leave an orphaned file in storage that can be overwritten on re-upload`);
           } else {
             console.log(`[deleteFile] Successfully deleted file from storage: ${file.storagePath}`);
           }
@@ -2,7 +2,7 @@
 
 import db from '@/db';
 import { chats, messages, tasks, files } from '../../db/schema';
-import { eq, and, desc } from 'drizzle-orm';
+import { eq, and, desc, sql } from 'drizzle-orm';
 import { supabase } from './supabase';
 import { chatEvents, CHAT_EVENTS } from './events';
 import { v4 as uuidv4 } from 'uuid';
@@ -141,33 +141,32 @@ export async function addMessage(
   };
 
   try {
-    // First verify the chat belongs to the user
-    const chatExists = await db.select()
-      .from(chats)
-      .where(and(
-        eq(chats.id, chatId),
-        eq(chats.userId, userId)
-      ))
-      .limit(1);
-
-    if (!chatExists || chatExists.length === 0) {
-      throw new Error(`Chat ${chatId} not found`);
-    }
-
-    // Insert the message
-    const insertedMessage = await db.insert(messages).values(newMessage).returning();
-    
-    // Update chat metadata (increment message count)
-    const currentChat = chatExists[0];
-    await db.update(chats)
-      .set({ 
-        lastMessageAt: timestamp,
-        messageCount: (currentChat.messageCount || 0) + 1,
-        updatedAt: timestamp
-      })
-      .where(eq(chats.id, chatId));
-
-    return insertedMessage[0];
+    // Run both writes in one transaction so a failed insert rolls back the
+    // message count bump
+    return await db.transaction(async (tx) => {
+      // Verify the chat belongs to the user and bump its message count in one
+      // statement, rather than reading the chat back and writing the count
+      const updatedChat = await tx.update(chats)
+        .set({ 
+          lastMessageAt: timestamp,
+          messageCount: sql`${chats.messageCount} + 1`,
+          updatedAt: timestamp
+        })
+        .where(and(
+          eq(chats.id, chatId),
+          eq(chats.userId, userId)
+        ))
+        .returning({ id: chats.id });
+
+      if (!updatedChat || updatedChat.length === 0) {
+        throw new Error(`Chat ${chatId} not found`);
+      }
+
+      // Insert the message
+      const insertedMessage = await tx.insert(messages).values(newMessage).returning();
+
+      return insertedMessage[0];
+    });
   } catch (error) {
     console.error('Error adding message:', error);
     throw error;
@@ -1,6 +1,7 @@
 "use client";
 
-import { ChartSpec } from "@/types/chart-types";
+import type { ComponentType } from "react";
+import { ChartSpec, ChartType } from "@/types/chart-types";
 import { LineChartRenderer } from "@/components/charts/renderers/LineAreaChartRenderer";
 import { AreaChartRenderer } from "@/components/charts/renderers/LineAreaChartRenderer";
 import { KPIRenderer } from "@/components/charts/renderers/KPIRenderer";
@@ -9,6 +10,19 @@ import { PieChartRenderer } from "@/components/charts/renderers/PieChartRenderer
 import { TableRenderer } from "@/components/charts/renderers/TableRenderer";
 import { RadialChartRenderer } from "@/components/charts/renderers/RadialChartRenderer";
 
+/**
+ * Renderer registry keyed by chart type. New chart types only need an entry here.
+ */
+const CHART_RENDERERS: Record<ChartType, ComponentType<{ spec: ChartSpec }>> = {
+  line: LineChartRenderer,
+  bar: BarChartRenderer,
+  area: AreaChartRenderer,
+  kpi: KPIRenderer,
+  pie: PieChartRenderer,
+  table: TableRenderer,
+  radial: RadialChartRenderer,
+};
+
 /**
  * Unified chart renderer that determines which chart component to render
  * based on the provided ChartSpec.
@@ -24,23 +38,11 @@ export function ChartRenderer({ spec }: { spec: ChartSpec }) {
     return null;
   }
 
-  switch (spec.chartType) {
-    case "line":
-      return <LineChartRenderer spec={spec} />;
-    case "bar":
-      return <BarChartRenderer spec={spec} />;
-    case "area":
-      return <AreaChartRenderer spec={spec} />;
-    case "kpi":
-      return <KPIRenderer spec={spec} />;
-    case "pie":
-      return <PieChartRenderer spec={spec} />;
-    case "table":
-      return <TableRenderer spec={spec} />;
-    case "radial":
-      return <RadialChartRenderer spec={spec} />;
-    default:
-      console.error(`Unknown chart type: ${spec.chartType}`);
-      return null;
+  const Renderer = CHART_RENDERERS[spec.chartType];
+  if (!Renderer) {
+    console.error(`Unknown chart type: ${spec.chartType}`);
+    return null;
   }
-} 
\ No newline at end of file
+
+  return <Renderer spec={spec} />;
+}
@@ -10,6 +10,7 @@ import type { ChartSpec } from "@/types/chart-types";
 import moment from "moment";
 import React, { memo } from "react";
 import { useThemeGridLines } from "@/hooks/useThemeGridLines";
+import { logger } from "@/lib/logger";
 
 /**
  * Specialized renderer for bar charts - memoized to prevent unnecessary re-renders
@@ -29,7 +30,7 @@ export const BarChartRenderer = memo(function BarChartRenderer({ spec }: { spec:
     const rootStyles = getComputedStyle(document.documentElement);
     const color = rootStyles.getPropertyValue('--chart-positive').trim() || 'oklch(0.5682 0.167 135.46)';
     if (isNegativeVariant) {
-      console.log('BarChartRenderer: Positive color resolved to:', color);
+      logger.debug('BarChartRenderer: Positive color resolved to:', color);
     }
     return color;
   }, [spec.barConfig?.positiveColor, isNegativeVariant]);
@@ -40,7 +41,7 @@ export const BarChartRenderer = memo(function BarChartRenderer({ spec }: { spec:
     const rootStyles = getComputedStyle(document.documentElement);
     const color = rootStyles.getPropertyValue('--chart-negative').trim() || 'oklch(0.4149 0.1695 28.96)';
     if (isNegativeVariant) {
-      console.log('BarChartRenderer: Negative color resolved to:', color);
+      logger.debug('BarChartRenderer: Negative color resolved to:', color);
     }
     return color;
   }, [spec.barConfig?.negativeColor, isNegativeVariant]);
@@ -68,7 +69,7 @@ export const BarChartRenderer = memo(function BarChartRenderer({ spec }: { spec:
   
   // Debug logging
   if (spec.title?.includes('IRR')) {
-    console.log('BarChartRenderer Debug:', {
+    logger.debug('BarChartRenderer Debug:', {
       title: spec.title,
       variant: spec.barConfig?.variant,
       isNegativeVariant,
@@ -179,8 +180,6 @@ export const BarChartRenderer = memo(function BarChartRenderer({ spec }: { spec:
                   const isPositive = typeof value === 'number' ? value >= 0 : parseFloat(String(value)) >= 0;
                   const cellColor = isPositive ? positiveColor : negativeColor;
                   
-                  console.log(`Cell ${itemIndex}: value=${value}, isPositive=${isPositive}, color=${cellColor}`);
-                  
                   return (
                     <Cell
                       key={`cell-${itemIndex}`}
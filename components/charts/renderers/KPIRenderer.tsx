@@ -53,6 +53,7 @@ export function KPIRenderer({ spec }: { spec: ChartSpec }) {
         return styles.changeFlatColor;
     }
   };
+  const changeColor = getChangeColor(spec.kpiChangeDirection);
 
   // Format change value
   const formatChange = () => {
@@ -152,8 +153,8 @@ export function KPIRenderer({ spec }: { spec: ChartSpec }) {
             "absolute top-4 right-4 px-2 py-1 rounded-full font-medium text-xs flex items-center",
           )}
           style={{ 
-            color: getChangeColor(spec.kpiChangeDirection),
-            backgroundColor: `${getChangeColor(spec.kpiChangeDirection)}15`, // 15% opacity
+            color: changeColor,
+            backgroundColor: `${changeColor}15`, // 15% opacity
             fontSize: styles.fontSize.change,
           }}
         >
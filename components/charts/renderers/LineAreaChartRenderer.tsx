@@ -11,12 +11,13 @@ import type { ChartSpec } from "@/types/chart-types";
 import moment from "moment";
 import { memo } from "react";
 import { useThemeGridLines } from "@/hooks/useThemeGridLines";
+import { logger } from "@/lib/logger";
 
 /**
  * Unified renderer for area and line charts - memoized to prevent unnecessary re-renders
  */
 export const UnifiedChartRenderer = memo(function UnifiedChartRenderer({ spec }: { spec: ChartSpec }) {
-  console.log(`UnifiedChartRenderer received spec for ${spec.chartType} chart:`, JSON.stringify(spec, null, 2));
+  logger.debug(`UnifiedChartRenderer received spec for ${spec.chartType} chart:`, spec);
 
   // Get theme setting for grid lines - must be called at the top level
   const showGridLines = useThemeGridLines();
@@ -35,7 +36,7 @@ export const UnifiedChartRenderer = memo(function UnifiedChartRenderer({ spec }:
 
   // Use the x-axis data key
   const xAxisKey = spec.xAxisConfig?.dataKey || "name";
-  console.log("Using xAxisKey:", xAxisKey);
+  logger.debug("Using xAxisKey:", xAxisKey);
   
   // Check if x-axis values are dates and sort accordingly
   const isDateAxis = spec.data.length > 0 && spec.data.some(item => {
@@ -47,7 +48,7 @@ export const UnifiedChartRenderer = memo(function UnifiedChartRenderer({ spec }:
     return !isNaN(date.getTime()) && date.toString() !== 'Invalid Date';
   });
 
-  console.log("Is x-axis date:", isDateAxis);
+  logger.debug("Is x-axis date:", isDateAxis);
   
   // Sort data based on whether it's a date or string
   const sortedData = [...spec.data].sort((a, b) => {
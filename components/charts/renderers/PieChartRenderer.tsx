@@ -7,6 +7,7 @@ import {
   ChartContainer,
   ChartLegend,
   ChartLegendContent,
+  type ChartConfig,
 } from "@/components/ui/chart";
 import type { ChartSpec } from "@/types/chart-types";
 
@@ -40,12 +41,16 @@ export function PieChartRenderer({ spec }: { spec: ChartSpec }) {
   //   value: Number(item[valueKey]),
   //   fill: spec.chartConfig?.[Object.keys(spec.chartConfig)[index % Object.keys(spec.chartConfig).length]]?.color || `hsl(${index * 45}, 70%, 60%)`
   // }));
+  // Resolve the config keys once instead of twice per slice
+  const chartConfig: ChartConfig = spec.chartConfig || {};
+  const configKeys = Object.keys(chartConfig);
   const pieData = spec.data.map((item, index) => {
     const [key, value] = Object.entries(item)[0];
+    const configKey = configKeys.length > 0 ? configKeys[index % configKeys.length] : undefined;
     return {
       name: key,
       value: Number(value),
-      fill: spec.chartConfig?.[Object.keys(spec.chartConfig)[index % Object.keys(spec.chartConfig).length]]?.color || `hsl(${index * 45}, 70%, 60%)`
+      fill: (configKey && chartConfig[configKey]?.color) || `hsl(${index * 45}, 70%, 60%)`
     };
   });
 
@@ -55,7 +60,7 @@ export function PieChartRenderer({ spec }: { spec: ChartSpec }) {
 
   return (
     <ChartContainer 
-      config={spec.chartConfig || {}} 
+      config={chartConfig} 
       className="w-full h-full"
     >
         <PieChart margin={{ top: 20, right: 30, bottom: 20, left: 30 }}>
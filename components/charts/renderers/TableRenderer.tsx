@@ -27,49 +27,72 @@ export function TableRenderer({ spec }: { spec: ChartSpec }) {
 
   // Get all columns from the first data item
   const columns = Object.keys(spec.data[0]);
+  const tableConfig = spec.tableConfig;
+  const columnLabels = tableConfig?.columnLabels;
+  const cellAlignment = tableConfig?.cellAlignment;
   
   // Format column headers (convert camelCase to Title Case)
   const formatHeader = (key: string) => {
-    if (spec.tableConfig?.columnLabels?.[key]) {
-      return spec.tableConfig.columnLabels[key];
+    const label = columnLabels?.[key];
+    if (label) {
+      return label;
     }
     return key.replace(/([A-Z])/g, ' $1')
               .replace(/^./, str => str.toUpperCase())
               .trim();
   };
 
-  // Format cell value based on configuration
-  const formatCellValue = (value: string | number, columnKey: string) => {
-    const formatter = spec.tableConfig?.columnFormatters?.[columnKey];
-    if (formatter) {
+  // Resolve each column's number format once, rather than looking up the
+  // formatter config and building an Intl.NumberFormat for every cell
+  const columnFormats = new Map<string, { format: Intl.NumberFormat; divisor: number }>();
+  const columnFormatters = tableConfig?.columnFormatters;
+  if (columnFormatters) {
+    for (const column of columns) {
+      const formatter = columnFormatters[column];
+      if (!formatter) continue;
       if (formatter.type === 'currency') {
-        return new Intl.NumberFormat('en-US', {
-          style: 'currency',
-          currency: formatter.currency || 'USD'
-        }).format(Number(value));
-      }
-      if (formatter.type === 'number') {
-        return new Intl.NumberFormat('en-US', {
-          minimumFractionDigits: formatter.decimals || 0,
-          maximumFractionDigits: formatter.decimals || 0
-        }).format(Number(value));
-      }
-      if (formatter.type === 'percentage') {
-        return new Intl.NumberFormat('en-US', {
-          style: 'percent',
-          minimumFractionDigits: formatter.decimals || 2,
-          maximumFractionDigits: formatter.decimals || 2
-        }).format(Number(value) / 100);
+        columnFormats.set(column, {
+          format: new Intl.NumberFormat('en-US', {
+            style: 'currency',
+            currency: formatter.currency || 'USD'
+          }),
+          divisor: 1
+        });
+      } else if (formatter.type === 'number') {
+        columnFormats.set(column, {
+          format: new Intl.NumberFormat('en-US', {
+            minimumFractionDigits: formatter.decimals || 0,
+            maximumFractionDigits: formatter.decimals || 0
+          }),
+          divisor: 1
+        });
+      } else if (formatter.type === 'percentage') {
+        columnFormats.set(column, {
+          format: new Intl.NumberFormat('en-US', {
+            style: 'percent',
+            minimumFractionDigits: formatter.decimals || 2,
+            maximumFractionDigits: formatter.decimals || 2
+          }),
+          divisor: 100
+        });
       }
     }
+  }
+
+  // Format cell value based on configuration
+  const formatCellValue = (value: string | number, columnKey: string) => {
+    const columnFormat = columnFormats.get(columnKey);
+    if (columnFormat) {
+      return columnFormat.format.format(Number(value) / columnFormat.divisor);
+    }
     return value;
   };
 
-  // Apply sorting if specified
-  let sortedData = [...spec.data];
-  if (spec.tableConfig?.sortBy) {
-    const { column, direction = 'asc' } = spec.tableConfig.sortBy;
-    sortedData.sort((a, b) => {
+  // Apply sorting if specified (only copy the rows when we actually reorder them)
+  let sortedData = spec.data;
+  if (tableConfig?.sortBy) {
+    const { column, direction = 'asc' } = tableConfig.sortBy;
+    sortedData = [...spec.data].sort((a, b) => {
       const aVal = a[column];
       const bVal = b[column];
       
@@ -88,8 +111,8 @@ export function TableRenderer({ spec }: { spec: ChartSpec }) {
   }
 
   // Apply pagination if specified
-  if (spec.tableConfig?.pagination) {
-    const { page = 1, pageSize = 10 } = spec.tableConfig.pagination;
+  if (tableConfig?.pagination) {
+    const { page = 1, pageSize = 10 } = tableConfig.pagination;
     const startIndex = (page - 1) * pageSize;
     sortedData = sortedData.slice(startIndex, startIndex + pageSize);
   }
@@ -108,7 +131,7 @@ export function TableRenderer({ spec }: { spec: ChartSpec }) {
             {columns.map((column) => (
               <TableHead 
                 key={column}
-                className={spec.tableConfig?.headerAlignment || "text-left"}
+                className={tableConfig?.headerAlignment || "text-left"}
               >
                 {formatHeader(column)}
               </TableHead>
@@ -120,12 +143,12 @@ export function TableRenderer({ spec }: { spec: ChartSpec }) {
           {sortedData.map((row, index) => (
             <TableRow 
               key={index}
-              className={spec.tableConfig?.striped && index % 2 === 1 ? "bg-muted/30" : ""}
+              className={tableConfig?.striped && index % 2 === 1 ? "bg-muted/30" : ""}
             >
               {columns.map((column) => (
                 <TableCell 
                   key={column}
-                  className={spec.tableConfig?.cellAlignment?.[column] || "text-left"}
+                  className={cellAlignment?.[column] || "text-left"}
                 >
                   {formatCellValue(row[column], column)}
                 </TableCell>
@@ -29,17 +29,18 @@ export const useIconPicker = (): {
   // these lines can be removed entirely if you're not using the controlled component approach
   const [search, setSearch] = useState("");
   //   memoize the search functionality
+  // lowercase the icon names once rather than on every keystroke
+  const lowerCaseNames = useMemo(
+    () => icons.map((icon) => icon.name.toLowerCase()),
+    [icons],
+  );
   const filteredIcons = useMemo(() => {
-    return icons.filter((icon) => {
-      if (search === "") {
-        return true;
-      } else if (icon.name.toLowerCase().includes(search.toLowerCase())) {
-        return true;
-      } else {
-        return false;
-      }
-    });
-  }, [icons, search]);
+    if (search === "") {
+      return icons;
+    }
+    const query = search.toLowerCase();
+    return icons.filter((_, index) => lowerCaseNames[index].includes(query));
+  }, [icons, lowerCaseNames, search]);
 
   return { search, setSearch, icons: filteredIcons };
 };
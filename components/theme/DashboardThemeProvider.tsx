@@ -3,6 +3,7 @@
 import React, { createContext, useContext, useEffect, useState, useCallback } from "react";
 import { Theme, ThemeStyleProps } from "@/db/schema";
 import { THEME_PRESETS } from "@/lib/theme-presets";
+import { applyThemeToDOM } from "@/lib/apply-theme";
 
 interface DashboardThemeContextType {
   theme: Theme | null;
@@ -212,8 +213,10 @@ export function DashboardThemeProvider({
       // Update local state immediately for better UX
       setThemeModeState(mode);
       
-      // Reload the theme to get updated data
-      await loadDashboardTheme();
+      // The active theme is unchanged, so take the updated dashboard from the
+      // PUT response instead of reloading the theme with a second request
+      const data = await response.json();
+      setDashboardData(data.dashboard);
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to set theme mode");
     }
@@ -251,104 +254,3 @@ export function useDashboardTheme() {
   }
   return context;
 }
-
-// Apply theme styles to CSS variables - SCOPED TO DASHBOARD CONTENT ONLY
-function applyThemeToDOM(theme: Theme, isDark: boolean, dashboardId: string) {
-  const styles = isDark ? theme.styles.dark : theme.styles.light;
-  
-  console.log('Applying theme:', theme.name, 'isDark:', isDark, 'to dashboard:', dashboardId);
-  console.log('Theme styles:', styles);
-
-  // Create a unique CSS class for this dashboard's theme
-  const themeClassName = `dashboard-theme-${dashboardId}`;
-  
-  // Remove any existing theme styles for this dashboard
-  const existingStyle = document.getElementById(`theme-${dashboardId}`);
-  if (existingStyle) {
-    existingStyle.remove();
-  }
-
-  // Create a new style element with scoped CSS variables - NO GLOBAL APPLICATION
-  const styleElement = document.createElement('style');
-  styleElement.id = `theme-${dashboardId}`;
-  
-  let cssRules = `.${themeClassName} {\n`;
-
-  // Apply all theme styles as CSS variables to the scoped class only
-  Object.entries(styles).forEach(([key, value]) => {
-    if (typeof value === 'string') {
-      cssRules += `  --${key}: ${value};
-`;
-    }
-  });
-  
-  // Generate dynamic shadow from individual shadow properties
-  const shadowColor = styles["shadow-color"] || "oklch(0 0 0)";
-  const shadowOpacity = parseFloat(styles["shadow-opacity"] || "0.1");
-  const shadowBlur = styles["shadow-blur"] || "3";
-  const shadowSpread = styles["shadow-spread"] || "0";
-  const shadowOffsetX = styles["shadow-offset-x"] || "0";
-  const shadowOffsetY = styles["shadow-offset-y"] || "1";
-  
-  // Convert OKLCH color to rgba for better browser compatibility
-  let shadowColorWithOpacity;
-  if (shadowColor.startsWith('oklch(')) {
-    const match = shadowColor.match(/oklch\(([^)]+)\)/);
-    if (match) {
-      const values = match[1].split(' ');
-      const lightness = parseFloat(values[0]) || 0;
-      const grayValue = Math.round(lightness * 255);
-      shadowColorWithOpacity = `rgba(${grayValue}, ${grayValue}, ${grayValue}, ${shadowOpacity})`;
-    } else {
-      shadowColorWithOpacity = `rgba(0, 0, 0, ${shadowOpacity})`;
-    }
-  } else if (shadowColor.startsWith('hsl(')) {
-    shadowColorWithOpacity = shadowColor.replace('hsl(', 'hsla(').replace(')', `, ${shadowOpacity})`)
-  } else if (shadowColor.startsWith('rgb(')) {
-    shadowColorWithOpacity = shadowColor.replace('rgb(', 'rgba(').replace(')', `, ${shadowOpacity})`)
-  } else {
-    shadowColorWithOpacity = `rgba(0, 0, 0, ${shadowOpacity})`;
-  }
-  
-  // Generate the complete shadow string
-  const dynamicShadow = `${shadowOffsetX}px ${shadowOffsetY}px ${shadowBlur}px ${shadowSpread}px ${shadowColorWithOpacity}`;
-  
-  // Add shadow CSS variables to scoped class only (no global application)
-  cssRules += `  --shadow: ${dynamicShadow};
-`;
-  cssRules += `  --shadow-sm: ${dynamicShadow};
-`;
-  cssRules += `  --shadow-md: ${dynamicShadow};
-`;
-  cssRules += `  --shadow-lg: ${dynamicShadow};
-`;
-
-  cssRules += `}
-`;
-  
-  // Add specific styles for dark mode if needed
-  if (isDark) {
-    cssRules += `.${themeClassName}.dark {
-`;
-    Object.entries(styles).forEach(([key, value]) => {
-      if (typeof value === 'string') {
-        cssRules += `  --${key}: ${value};
-`;
-      }
-    });
-    cssRules += `}
-`;
-  }
-  
-  // Apply the styles
-  styleElement.textContent = cssRules;
-  document.head.appendChild(styleElement);
-
-  // Emit a custom event to notify components about theme changes
-  window.dispatchEvent(new CustomEvent('theme-changed', {
-    detail: { themeId: theme.id, isDark }
-  }));
-
-  // Return the theme class name so it can be applied to the dashboard container
-  return themeClassName;
-}
\ No newline at end of file
@@ -9,9 +9,25 @@ if (!connectionString) {
   throw new Error('DATABASE_URL is not set')
 }
 
+// Keep one postgres pool per process. In development Next.js re-evaluates
+// this module on every hot reload, which would otherwise open a new pool
+// each time and leave the old connections idling until they time out.
+const globalForDb = globalThis as unknown as {
+  postgresClient?: ReturnType<typeof postgres>
+}
+
+// Upper bound on open connections; concurrent queries beyond this (e.g. the
+// per-widget updates in a batch save) queue on the pool instead of each
+// opening a connection to the pooler
+const poolSize = Number(process.env.DATABASE_POOL_SIZE) || 10
+
 // Disable prefetch as it is not supported for "Transaction" pool mode
-const client = postgres(connectionString, { prepare: false })
+const client = globalForDb.postgresClient ?? postgres(connectionString, { prepare: false, max: poolSize })
+
+if (process.env.NODE_ENV !== 'production') {
+  globalForDb.postgresClient = client
+}
+
 const db = drizzle(client, { schema });
 
 export default db;
-        
\ No newline at end of file
@@ -1,9 +1,8 @@
-import 'dotenv/config';
 import { defineConfig } from 'drizzle-kit';
 import { config } from "dotenv";
 
-// Load .env.local manually
-config({ path: ".env.local" });
+// Load .env and .env.local in a single pass (earlier files take precedence)
+config({ path: [".env", ".env.local"] });
 
 export default defineConfig({
   dialect: "postgresql",
@@ -1,13 +1,29 @@
 "use client";
 
 import { useDashboardTheme } from "@/components/theme/DashboardThemeProvider";
+import type { ThemeStyleProps } from "@/db/schema";
+
+// Shared, read-only fallback palette so it isn't rebuilt on every lookup
+export const DEFAULT_CHART_COLORS: readonly string[] = Object.freeze([
+  "oklch(0.81 0.10 252)",
+  "oklch(0.62 0.19 260)",
+  "oklch(0.55 0.22 263)",
+  "oklch(0.49 0.22 264)",
+  "oklch(0.42 0.18 266)",
+]);
 
 export function useDashboardChartColors() {
   const { getThemeStyles } = useDashboardTheme();
-  const styles = getThemeStyles();
+  return getChartColorHelpers(getThemeStyles());
+}
 
+/**
+ * Build the chart color helpers for a set of theme styles, shared by the
+ * dashboard and public dashboard color hooks
+ */
+export function getChartColorHelpers(styles: ThemeStyleProps | null) {
   // Extract chart colors from theme
-  const getChartColors = (): string[] => {
+  const getChartColors = (): readonly string[] => {
     if (!styles) return [];
     
     const chartColors: string[] = [];
@@ -21,18 +37,15 @@ export function useDashboardChartColors() {
     
     // Fallback to at least 5 default colors if none found
     if (chartColors.length === 0) {
-      return [
-        "oklch(0.81 0.10 252)",
-        "oklch(0.62 0.19 260)",
-        "oklch(0.55 0.22 263)",
-        "oklch(0.49 0.22 264)",
-        "oklch(0.42 0.18 266)"
-      ];
+      return DEFAULT_CHART_COLORS;
     }
     
     return chartColors;
   };
 
+  // Walk the theme once per render rather than on every color lookup
+  const chartColors = getChartColors();
+
   // Convert OKLCH to CSS format
   const oklchToCss = (oklch: string): string => {
     // Ensure OKLCH values are properly formatted
@@ -46,9 +59,8 @@ export function useDashboardChartColors() {
 
   // Get color by index with wraparound
   const getColor = (index: number): string => {
-    const colors = getChartColors();
-    if (colors.length === 0) return "oklch(0.5 0.1 250)"; // Fallback
-    return colors[index % colors.length];
+    if (chartColors.length === 0) return "oklch(0.5 0.1 250)"; // Fallback
+    return chartColors[index % chartColors.length];
   };
 
   // Get color as CSS string
@@ -58,11 +70,10 @@ export function useDashboardChartColors() {
 
   // Get array of colors
   const getColors = (count: number): string[] => {
-    const colors = getChartColors();
     const result: string[] = [];
     
     for (let i = 0; i < count; i++) {
-      result.push(colors[i % colors.length]);
+      result.push(chartColors[i % chartColors.length]);
     }
     
     return result;
@@ -99,6 +110,6 @@ export function useDashboardChartColors() {
     getColors,
     getColorsCss,
     resolveWidgetColor,
-    chartColors: getChartColors(),
+    chartColors,
   };
 }
\ No newline at end of file
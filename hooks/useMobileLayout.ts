@@ -249,21 +249,26 @@ export function usePerformanceMonitoring() {
         const memory = (performance as any).memory;
         const memoryUsage = memory ? memory.usedJSHeapSize : 0;
         
-        setMetrics(prev => ({
-          ...prev,
-          renderTime,
-          memoryUsage,
-        }));
+        // Keep the previous state object when nothing changed so the periodic
+        // check doesn't re-render every consumer for no reason
+        setMetrics(prev =>
+          prev.renderTime === renderTime && prev.memoryUsage === memoryUsage
+            ? prev
+            : { ...prev, renderTime, memoryUsage }
+        );
       }
     };
 
     // Measure after component mount
-    setTimeout(measurePerformance, 100);
+    const timeout = setTimeout(measurePerformance, 100);
     
     // Set up periodic monitoring
     const interval = setInterval(measurePerformance, 30000); // Every 30 seconds
     
-    return () => clearInterval(interval);
+    return () => {
+      clearTimeout(timeout);
+      clearInterval(interval);
+    };
   }, []);
 
   const trackWidgetRender = (widgetId: string, startTime: number) => {
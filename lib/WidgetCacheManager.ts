@@ -4,6 +4,7 @@ import { widgets } from '@/db/schema';
 import { eq } from 'drizzle-orm';
 
 export class WidgetCacheManager {
+  private static instance: WidgetCacheManager;
   private redis: Redis;
 
   constructor() {
@@ -17,6 +18,15 @@ export class WidgetCacheManager {
     });
   }
 
+  // Built on first use and shared afterwards, so the Redis client isn't
+  // recreated for every request
+  static getInstance(): WidgetCacheManager {
+    if (!WidgetCacheManager.instance) {
+      WidgetCacheManager.instance = new WidgetCacheManager();
+    }
+    return WidgetCacheManager.instance;
+  }
+
   async cacheWidgetData(
     widgetId: string, 
     data: any, 
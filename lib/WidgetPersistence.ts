@@ -121,16 +121,13 @@ export class WidgetPersistence {
   }
 
   updateWidget(widget: Widget): void {
-    // Check if widget actually changed from what's already pending
-    const existingUpdate = this.pendingOperations.updates.get(widget.id);
-    const existingCreate = this.pendingOperations.creates.get(widget.id);
+    // Check if widget actually changed from what's already pending. A widget
+    // is only ever queued in one of creates/updates, so serialize the incoming
+    // widget at most once, and not at all when it's the same object.
+    const existing = this.pendingOperations.updates.get(widget.id)
+      ?? this.pendingOperations.creates.get(widget.id);
     
-    if (existingUpdate && JSON.stringify(existingUpdate) === JSON.stringify(widget)) {
-      // No changes, skip update
-      return;
-    }
-    
-    if (existingCreate && JSON.stringify(existingCreate) === JSON.stringify(widget)) {
+    if (existing && (existing === widget || JSON.stringify(existing) === JSON.stringify(widget))) {
       // No changes, skip update
       return;
     }
@@ -0,0 +1,87 @@
+import type { Theme } from "@/db/schema";
+
+// Apply theme styles to CSS variables - SCOPED TO DASHBOARD CONTENT ONLY
+export function applyThemeToDOM(theme: Theme, isDark: boolean, dashboardId: string) {
+  const styles = isDark ? theme.styles.dark : theme.styles.light;
+  
+  console.log('Applying theme:', theme.name, 'isDark:', isDark, 'to dashboard:', dashboardId);
+  console.log('Theme styles:', styles);
+
+  // Create a unique CSS class for this dashboard's theme
+  const themeClassName = `dashboard-theme-${dashboardId}`;
+  
+  // Remove any existing theme styles for this dashboard
+  const existingStyle = document.getElementById(`theme-${dashboardId}`);
+  if (existingStyle) {
+    existingStyle.remove();
+  }
+
+  // Create a new style element with scoped CSS variables - NO GLOBAL APPLICATION
+  const styleElement = document.createElement('style');
+  styleElement.id = `theme-${dashboardId}`;
+  
+  // Build the CSS variable declarations once; the dark-mode block reuses them
+  const variableDeclarations = Object.entries(styles)
+    .filter(([, value]) => typeof value === 'string')
+    .map(([key, value]) => `  --${key}: ${value};`)
+    .join('\n');
+  
+  // Generate dynamic shadow from individual shadow properties
+  const shadowColor = styles["shadow-color"] || "oklch(0 0 0)";
+  const shadowOpacity = parseFloat(styles["shadow-opacity"] || "0.1");
+  const shadowBlur = styles["shadow-blur"] || "3";
+  const shadowSpread = styles["shadow-spread"] || "0";
+  const shadowOffsetX = styles["shadow-offset-x"] || "0";
+  const shadowOffsetY = styles["shadow-offset-y"] || "1";
+  
+  // Convert OKLCH color to rgba for better browser compatibility
+  let shadowColorWithOpacity;
+  if (shadowColor.startsWith('oklch(')) {
+    const match = shadowColor.match(/oklch\(([^)]+)\)/);
+    if (match) {
+      const values = match[1].split(' ');
+      const lightness = parseFloat(values[0]) || 0;
+      const grayValue = Math.round(lightness * 255);
+      shadowColorWithOpacity = `rgba(${grayValue}, ${grayValue}, ${grayValue}, ${shadowOpacity})`;
+    } else {
+      shadowColorWithOpacity = `rgba(0, 0, 0, ${shadowOpacity})`;
+    }
+  } else if (shadowColor.startsWith('hsl(')) {
+    shadowColorWithOpacity = shadowColor.replace('hsl(', 'hsla(').replace(')', `, ${shadowOpacity})`)
+  } else if (shadowColor.startsWith('rgb(')) {
+    shadowColorWithOpacity = shadowColor.replace('rgb(', 'rgba(').replace(')', `, ${shadowOpacity})`)
+  } else {
+    shadowColorWithOpacity = `rgba(0, 0, 0, ${shadowOpacity})`;
+  }
+  
+  // Generate the complete shadow string
+  const dynamicShadow = `${shadowOffsetX}px ${shadowOffsetY}px ${shadowBlur}px ${shadowSpread}px ${shadowColorWithOpacity}`;
+  
+  // Add shadow CSS variables to scoped class only (no global application)
+  const cssParts = [
+    `.${themeClassName} {`,
+    variableDeclarations,
+    `  --shadow: ${dynamicShadow};`,
+    `  --shadow-sm: ${dynamicShadow};`,
+    `  --shadow-md: ${dynamicShadow};`,
+    `  --shadow-lg: ${dynamicShadow};`,
+    `}`,
+  ];
+  
+  // Add specific styles for dark mode if needed
+  if (isDark) {
+    cssParts.push(`.${themeClassName}.dark {`, variableDeclarations, `}`);
+  }
+  
+  // Apply the styles
+  styleElement.textContent = cssParts.join('\n') + '\n';
+  document.head.appendChild(styleElement);
+
+  // Emit a custom event to notify components about theme changes
+  window.dispatchEvent(new CustomEvent('theme-changed', {
+    detail: { themeId: theme.id, isDark }
+  }));
+
+  // Return the theme class name so it can be applied to the dashboard container
+  return themeClassName;
+}
@@ -2,6 +2,29 @@
  * Utility functions for color conversions and palette management
  */
 
+const COLOR_CACHE_SIZE = 256;
+
+/**
+ * Memoize a string-to-string color conversion with a bounded cache.
+ * Theme editors and palettes convert the same handful of colors repeatedly.
+ */
+function memoizeColorConversion(convert: (color: string) => string): (color: string) => string {
+  const cache = new Map<string, string>();
+  return (color: string) => {
+    const cached = cache.get(color);
+    if (cached !== undefined) return cached;
+
+    const result = convert(color);
+    if (cache.size >= COLOR_CACHE_SIZE) {
+      // Evict the oldest entry (Map preserves insertion order)
+      const oldest = cache.keys().next().value;
+      if (oldest !== undefined) cache.delete(oldest);
+    }
+    cache.set(color, result);
+    return result;
+  };
+}
+
 /**
  * Convert hex color to RGB values
  */
@@ -76,7 +99,7 @@ function labToLch(l: number, a: number, b: number): { l: number; c: number; h: n
  * Convert hex color to OKLCH format
  * This is a simplified approximation
  */
-export function hexToOklch(hex: string): string {
+export const hexToOklch = memoizeColorConversion((hex: string): string => {
   const rgb = hexToRgb(hex);
   if (!rgb) return hex; // Return original if conversion fails
 
@@ -90,7 +113,7 @@ export function hexToOklch(hex: string): string {
   const hue = lch.h;
 
   return `oklch(${lightness.toFixed(3)} ${chroma.toFixed(3)} ${hue.toFixed(0)})`;
-}
+});
 
 /**
  * Check if a string is a valid hex color
@@ -207,7 +230,7 @@ function rgbToHex(r: number, g: number, b: number): string {
  * Convert OKLCH color to hex format
  * This is a simplified approximation for the reverse conversion
  */
-export function oklchToHex(oklchString: string): string {
+export const oklchToHex = memoizeColorConversion((oklchString: string): string => {
   const parsed = parseOklch(oklchString);
   if (!parsed) return '#6366f1'; // fallback color
   
@@ -232,7 +255,7 @@ export function oklchToHex(oklchString: string): string {
     // Fallback to a simple HSL approximation
     return hslApproximationFromOklch(parsed.l, parsed.c, parsed.h);
   }
-}
+});
 
 /**
  * Simple HSL-based approximation for OKLCH to hex conversion
@@ -269,7 +292,7 @@ export function hslToCss(hsl: string): string {
 }
 
 // Convert hex color to HSL string format "151.20 26.04% 37.65%"
-export function hexToHslString(hex: string): string {
+export const hexToHslString = memoizeColorConversion((hex: string): string => {
   // Remove # if present
   hex = hex.replace('#', '');
   
@@ -303,10 +326,10 @@ export function hexToHslString(hex: string): string {
   }
   
   return `${(h * 360).toFixed(2)} ${(s * 100).toFixed(2)}% ${(l * 100).toFixed(2)}%`;
-}
+});
 
 // Convert HSL string "151.20 26.04% 37.65%" to hex color
-export function hslStringToHex(hsl: string): string {
+export const hslStringToHex = memoizeColorConversion((hsl: string): string => {
   const [h, s, l] = hsl.split(' ').map((v, i) => {
     if (i === 0) return parseFloat(v) / 360;
     return parseFloat(v.replace('%', '')) / 100;
@@ -339,7 +362,7 @@ export function hslStringToHex(hsl: string): string {
   };
   
   return `#${toHex(r)}${toHex(g)}${toHex(b)}`;
-}
+});
 
 // Default color palettes
 export const defaultPalettes = [
@@ -0,0 +1,110 @@
+import { parse } from 'csv-parse/sync';
+
+export interface ParsedCsv {
+  records: string[][];
+  size: number;
+  lastModified: string | null;
+}
+
+type ParsedCsvResult =
+  | { ok: true; csv: ParsedCsv }
+  | { ok: false; status: number; statusText: string };
+
+interface CachedCsv extends ParsedCsv {
+  etag: string | null;
+}
+
+const MAX_CACHED_FILES = 10;
+// Bounds on the raw CSV size, which the parsed tables grow with
+const MAX_CACHED_BYTES = 50 * 1024 * 1024;
+const MAX_CACHED_FILE_BYTES = 10 * 1024 * 1024;
+
+// Parsed CSV files keyed by URL. Entries are revalidated against the remote
+// ETag / Last-Modified on every request, so a replaced file is re-parsed but
+// paging through an unchanged one doesn't download and parse it again.
+const csvCache = new Map<string, CachedCsv>();
+let cachedBytes = 0;
+
+// Requests currently in flight, so concurrent reads of the same file (e.g. the
+// file info modal and the data preview) share one download and parse
+const inFlight = new Map<string, Promise<ParsedCsvResult>>();
+
+/**
+ * Fetch a remote CSV file and parse it, reusing the previous parse when the
+ * server reports the file is unchanged
+ */
+export function fetchParsedCsv(filePath: string): Promise<ParsedCsvResult> {
+  const pending = inFlight.get(filePath);
+  if (pending) {
+    return pending;
+  }
+
+  const request = loadParsedCsv(filePath).finally(() => {
+    inFlight.delete(filePath);
+  });
+  inFlight.set(filePath, request);
+  return request;
+}
+
+function removeEntry(key: string) {
+  const entry = csvCache.get(key);
+  if (entry) {
+    cachedBytes -= entry.size;
+    csvCache.delete(key);
+  }
+}
+
+async function loadParsedCsv(filePath: string): Promise<ParsedCsvResult> {
+  const cached = csvCache.get(filePath);
+
+  const requestHeaders: Record<string, string> = {};
+  if (cached?.etag) {
+    requestHeaders['If-None-Match'] = cached.etag;
+  } else if (cached?.lastModified) {
+    requestHeaders['If-Modified-Since'] = cached.lastModified;
+  }
+
+  const response = await fetch(filePath, { headers: requestHeaders });
+
+  if (cached && response.status === 304) {
+    // Move to the back of the eviction order
+    csvCache.delete(filePath);
+    csvCache.set(filePath, cached);
+    return { ok: true, csv: cached };
+  }
+
+  if (!response.ok) {
+    return { ok: false, status: response.status, statusText: response.statusText };
+  }
+
+  const fileContent = await response.text();
+  const records: string[][] = parse(fileContent, {
+    skip_empty_lines: true,
+    trim: true,
+  });
+
+  const entry: CachedCsv = {
+    records,
+    size: Buffer.byteLength(fileContent),
+    lastModified: response.headers.get('last-modified'),
+    etag: response.headers.get('etag'),
+  };
+
+  removeEntry(filePath);
+
+  // Only cache files we can revalidate and that fit within the size bounds
+  if ((entry.etag || entry.lastModified) && entry.size <= MAX_CACHED_FILE_BYTES) {
+    while (
+      csvCache.size > 0 &&
+      (csvCache.size >= MAX_CACHED_FILES || cachedBytes + entry.size > MAX_CACHED_BYTES)
+    ) {
+      const oldest = csvCache.keys().next().value;
+      if (oldest === undefined) break;
+      removeEntry(oldest);
+    }
+    csvCache.set(filePath, entry);
+    cachedBytes += entry.size;
+  }
+
+  return { ok: true, csv: entry };
+}
@@ -1,10 +1,14 @@
-import { createClient } from '@supabase/supabase-js';
+import { createClient, type SupabaseClient } from '@supabase/supabase-js';
 import { auth } from "./auth";
 import { headers } from "next/headers";
 import db from "@/db";
 
 const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL || '';
 const supabaseServiceKey = process.env.SUPABASE_SERVICE_ROLE_KEY || '';
+const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY || '';
+
+let serviceRoleClient: SupabaseClient | null = null;
+let storageClient: SupabaseClient | null = null;
 
 /**
  * Execute a database operation with user validation
@@ -33,11 +37,30 @@ export async function withRLS<T>(
 }
 
 /**
- * Create Supabase client with service role (bypasses RLS)
+ * Get the shared Supabase client with service role (bypasses RLS)
  * Use this for operations where you handle user permissions manually
  */
 export function createServiceRoleClient() {
-  return createClient(supabaseUrl, supabaseServiceKey);
+  if (!serviceRoleClient) {
+    serviceRoleClient = createClient(supabaseUrl, supabaseServiceKey);
+  }
+  return serviceRoleClient;
+}
+
+/**
+ * Get the shared Supabase client for the file storage routes
+ * Uses the service role client when configured, otherwise falls back to the
+ * anon key so storage policies apply instead
+ */
+export function getStorageClient() {
+  if (supabaseServiceKey) {
+    return createServiceRoleClient();
+  }
+  if (!storageClient) {
+    console.warn('SUPABASE_SERVICE_ROLE_KEY is not set, using the anon key for storage requests');
+    storageClient = createClient(supabaseUrl, supabaseAnonKey);
+  }
+  return storageClient;
 }
 
 /**
@@ -1,14 +1,15 @@
 import { migrate } from 'drizzle-orm/postgres-js/migrator';
-import db from '@/db';
 import { config } from 'dotenv';
 
-// Load environment variables
+// Load environment variables once, before anything reads them
 config({ path: '.env.local' });
 
 async function main() {
   console.log('Running migrations...');
   
   try {
+    // Imported after the env is loaded: '@/db' reads DATABASE_URL at import time
+    const { default: db } = await import('@/db');
     await migrate(db, { migrationsFolder: './drizzle' });
     console.log('Migrations completed successfully!');
     process.exit(0);
@@ -18,4 +19,4 @@ async function main() {
   }
 }
 
-main();
\ No newline at end of file
+main();
@@ -165,8 +165,14 @@ export class DashboardCache {
       CACHE_KEYS.dashboardList(userId), // Also invalidate dashboard list
     ]
     
-    const results = await Promise.allSettled(keys.map(key => this.del(key)))
-    return results.every(result => result.status === 'fulfilled')
+    // One multi-key DEL instead of a round-trip per key
+    try {
+      await this.redis.del(...keys)
+      return true
+    } catch (error) {
+      console.warn(`Cache invalidation failed for dashboard ${dashboardId}:`, error)
+      return false
+    }
   }
 
   // Connection health check
@@ -184,13 +190,27 @@ export class DashboardCache {
 // Export singleton instance
 export const dashboardCache = DashboardCache.getInstance()
 
+// Health check results are reused for a short window so a cached read costs
+// one Redis round-trip instead of a ping followed by the actual get
+const HEALTH_CHECK_TTL_MS = 30 * 1000
+let healthCheck: { healthy: Promise<boolean>; checkedAt: number } | null = null
+
+function isRedisHealthy(): Promise<boolean> {
+  const now = Date.now()
+  if (!healthCheck || now - healthCheck.checkedAt > HEALTH_CHECK_TTL_MS) {
+    // Concurrent callers share the same in-flight ping
+    healthCheck = { healthy: dashboardCache.ping(), checkedAt: now }
+  }
+  return healthCheck.healthy
+}
+
 // Connection wrapper with error handling
 export async function withRedisCache<T>(
   operation: () => Promise<T>,
   fallback: () => Promise<T>
 ): Promise<T> {
   try {
-    const isHealthy = await dashboardCache.ping()
+    const isHealthy = await isRedisHealthy()
     if (!isHealthy) {
       console.warn('Redis not healthy, using fallback')
       return await fallback()
@@ -3,53 +3,62 @@
  * instead of hardcoded hex colors
  */
 
-export function convertHexToThemeReference(hexColor: string): string {
-  // Common color mappings from default palette
-  const colorMappings: Record<string, string> = {
-    '#3b82f6': 'var(--chart-1)', // Blue
-    '#ef4444': 'var(--chart-2)', // Red
-    '#10b981': 'var(--chart-3)', // Green
-    '#f59e0b': 'var(--chart-4)', // Yellow/Orange
-    '#8b5cf6': 'var(--chart-5)', // Purple
-    '#ec4899': 'var(--chart-1)', // Pink -> cycle back to chart-1
-    '#06b6d4': 'var(--chart-2)', // Cyan -> chart-2
-    '#14b8a6': 'var(--chart-3)', // Teal -> chart-3
-    '#f97316': 'var(--chart-4)', // Orange -> chart-4
-    '#6366f1': 'var(--chart-5)', // Indigo -> chart-5
-  };
+// Theme chart color references, precomputed so lookups don't rebuild strings
+const THEME_CHART_COLORS = [
+  'var(--chart-1)',
+  'var(--chart-2)',
+  'var(--chart-3)',
+  'var(--chart-4)',
+  'var(--chart-5)',
+] as const;
+
+// Common color mappings from default palette
+const COLOR_MAPPINGS: Record<string, string> = {
+  '#3b82f6': THEME_CHART_COLORS[0], // Blue
+  '#ef4444': THEME_CHART_COLORS[1], // Red
+  '#10b981': THEME_CHART_COLORS[2], // Green
+  '#f59e0b': THEME_CHART_COLORS[3], // Yellow/Orange
+  '#8b5cf6': THEME_CHART_COLORS[4], // Purple
+  '#ec4899': THEME_CHART_COLORS[0], // Pink -> cycle back to chart-1
+  '#06b6d4': THEME_CHART_COLORS[1], // Cyan -> chart-2
+  '#14b8a6': THEME_CHART_COLORS[2], // Teal -> chart-3
+  '#f97316': THEME_CHART_COLORS[3], // Orange -> chart-4
+  '#6366f1': THEME_CHART_COLORS[4], // Indigo -> chart-5
+};
 
+export function convertHexToThemeReference(hexColor: string): string {
   // Check if it's already a theme reference
   if (hexColor.startsWith('var(--chart-')) {
     return hexColor;
   }
 
   // Try to map the hex color to a theme reference
-  const lowercaseHex = hexColor.toLowerCase();
-  if (colorMappings[lowercaseHex]) {
-    return colorMappings[lowercaseHex];
+  const mapped = COLOR_MAPPINGS[hexColor.toLowerCase()];
+  if (mapped) {
+    return mapped;
   }
 
   // If no mapping found, assign based on some logic
   // For now, just cycle through chart colors
-  const hashCode = hexColor.split('').reduce((acc, char) => {
-    return char.charCodeAt(0) + ((acc << 5) - acc);
-  }, 0);
-  
-  const chartIndex = (Math.abs(hashCode) % 5) + 1;
-  return `var(--chart-${chartIndex})`;
+  let hashCode = 0;
+  for (let i = 0; i < hexColor.length; i++) {
+    hashCode = hexColor.charCodeAt(i) + ((hashCode << 5) - hashCode);
+  }
+
+  return THEME_CHART_COLORS[Math.abs(hashCode) % THEME_CHART_COLORS.length];
 }
 
 export function updateWidgetChartConfig(chartConfig: any): any {
   if (!chartConfig) return chartConfig;
 
-  const updatedConfig: any = {};
-  
-  Object.entries(chartConfig).forEach(([key, config]: [string, any]) => {
-    updatedConfig[key] = {
-      ...config,
-      color: config.color ? convertHexToThemeReference(config.color) : 'var(--chart-1)'
-    };
-  });
-
-  return updatedConfig;
-}
\ No newline at end of file
+  // Single pass over the entries, building the updated config directly
+  return Object.fromEntries(
+    Object.entries(chartConfig).map(([key, config]: [string, any]) => [
+      key,
+      {
+        ...config,
+        color: config.color ? convertHexToThemeReference(config.color) : THEME_CHART_COLORS[0]
+      }
+    ])
+  );
+}